@@ -11,6 +11,8 @@ import sys
 import os
 import shutil
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # =============================================================================
@@ -18,6 +20,13 @@ from pathlib import Path
 # =============================================================================
 NUCLEI_TEMPLATES_PATH = "/path/nuclei-templates/http/exposures/"
 
+# HTTPX OPTIONS - shared by the subdomain and JS probes
+HTTPX_OPTIONS = "-threads 100 -rate-limit 500"
+
+# FAST DEDUP - memory limit (MB) for the URL set before --fast-dedup
+# falls back to sort -u
+FAST_DEDUP_MAX_MB = 2048
+
 # TELEGRAM NOTIFICATIONS (optional - leave empty to disable)
 TELEGRAM_BOT_TOKEN = ""  # Get from @BotFather on Telegram
 TELEGRAM_CHAT_ID = ""    # Your chat ID or group ID
@@ -26,62 +35,116 @@ TELEGRAM_CHAT_ID = ""    # Your chat ID or group ID
 VERSION = "1.0.0"
 INSTALL_DIR = "/usr/local/bin"
 
+# I/O buffer sizes for streaming output, counting lines and copying files
+READ_CHUNK_SIZE = 64 * 1024
+OUTPUT_BUFFER_SIZE = 512 * 1024
+COUNT_CHUNK_SIZE = 1024 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Approximate per-URL cost of a set slot, used by open_url_dedup's memory estimate
+SET_ENTRY_OVERHEAD = 32
+
 
 def count_lines(filepath):
     """Count the number of lines in a file."""
     try:
-        if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                return sum(1 for _ in f)
-        return 0
+        count = 0
+        last = b''
+        # Missing files raise here, so no separate existence check is needed
+        with open(filepath, 'rb') as f:
+            # Count newlines in raw chunks instead of decoding every line
+            while True:
+                chunk = f.read(COUNT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                count += chunk.count(b'\n')
+                last = chunk[-1:]
+        # A final line without a trailing newline still counts
+        if last and last != b'\n':
+            count += 1
+        return count
     except Exception:
         return 0
 
 
+def stat_or_none(path):
+    """
+    Stat a path with a single syscall.
+    
+    Returns:
+        os.stat_result, or None if the path does not exist
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
 def send_telegram_notification(target_name, target_dir, results):
     """
-    Send scan results to Telegram.
+    Send scan results to Telegram in a background thread.
+    
+    The request is retried once on failure and both attempts share a
+    single HTTPS connection.
     
     Args:
         target_name: Name of the target
         target_dir: Path to results directory
         results: Dict with file names and line counts
+    
+    Returns:
+        Tuple (thread, outcome) where outcome['sent'] is True once the
+        thread has delivered the message, or None if not configured
     """
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-        return False
+        return None
     
-    try:
-        import urllib.request
-        import urllib.parse
-        
-        # Build message
-        message = f"🎯 *FastRec - Target: {target_name}*\n\n"
-        message += "📁 *Results:*\n"
-        
-        for filename, count in results.items():
-            if filename == "screenshots":
-                message += f"• screenshots: {count} images\n"
-            else:
-                message += f"• {filename}: {count} lines\n"
-        
-        message += "\n✅ Scan completed!"
-        
-        # Send to Telegram
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        data = urllib.parse.urlencode({
-            'chat_id': TELEGRAM_CHAT_ID,
-            'text': message,
-            'parse_mode': 'Markdown'
-        }).encode('utf-8')
-        
-        req = urllib.request.Request(url, data=data)
-        urllib.request.urlopen(req, timeout=10)
-        
-        return True
-        
-    except Exception as e:
-        print(f"[!] Telegram notification failed: {e}")
-        return False
+    import http.client
+    import urllib.parse
+    
+    # Build message
+    message = f"🎯 *FastRec - Target: {target_name}*\n\n"
+    message += "📁 *Results:*\n"
+    
+    for filename, count in results.items():
+        if filename == "screenshots":
+            message += f"• screenshots: {count} images\n"
+        else:
+            message += f"• {filename}: {count} lines\n"
+    
+    message += "\n✅ Scan completed!"
+    
+    data = urllib.parse.urlencode({
+        'chat_id': TELEGRAM_CHAT_ID,
+        'text': message,
+        'parse_mode': 'Markdown'
+    })
+    headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+    outcome = {'sent': False, 'error': None}
+    
+    def _send():
+        conn = http.client.HTTPSConnection('api.telegram.org', timeout=10)
+        try:
+            for attempt in range(2):
+                try:
+                    conn.request('POST', f"/bot{TELEGRAM_BOT_TOKEN}/sendMessage",
+                                 body=data, headers=headers)
+                    response = conn.getresponse()
+                    response.read()
+                    if response.status == 200:
+                        outcome['sent'] = True
+                        return
+                    outcome['error'] = f"HTTP {response.status} {response.reason}"
+                except Exception as e:
+                    outcome['error'] = e
+                    # Drop the broken connection; the retry reconnects
+                    conn.close()
+        finally:
+            conn.close()
+    
+    thread = threading.Thread(target=_send, daemon=False)
+    thread.start()
+    return thread, outcome
 
 
 def print_banner():
@@ -198,6 +261,66 @@ def is_installed():
     return fastrec_path is not None and INSTALL_DIR in fastrec_path
 
 
+def copy_file(src, dst):
+    """
+    Copy a file with os.sendfile so the data never leaves the kernel.
+    Falls back to shutil.copyfile where sendfile is not available or the
+    filesystem does not support it.
+    
+    The data is written to a temporary file next to dst, which then
+    replaces dst in one step, so dst is never left half-written.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path (created or replaced)
+    
+    Raises:
+        shutil.SameFileError: If dst is src itself or a link to it
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+    
+    tmp = os.path.join(os.path.dirname(os.path.abspath(dst)),
+                       f".{os.path.basename(dst)}.tmp-{os.getpid()}")
+    
+    try:
+        copied = False
+        if hasattr(os, "sendfile"):
+            src_fd = os.open(src, os.O_RDONLY)
+            try:
+                dst_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                try:
+                    offset = 0
+                    while True:
+                        try:
+                            sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK_SIZE)
+                        except OSError:
+                            # EINVAL/ENOSYS on the first call means this
+                            # filesystem can't sendfile - copy it below
+                            if offset:
+                                raise
+                            break
+                        if sent == 0:
+                            copied = True
+                            break
+                        offset += sent
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+        
+        if not copied:
+            shutil.copyfile(src, tmp)
+        
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def install_tools():
     """
     Install fastrec and subshot to /usr/local/bin.
@@ -224,9 +347,11 @@ def install_tools():
     # Install fastrec
     print(f"[*] Installing fastrec to {fastrec_dst}...")
     try:
-        shutil.copy2(fastrec_src, fastrec_dst)
+        copy_file(fastrec_src, fastrec_dst)
         os.chmod(fastrec_dst, 0o755)
         print(f"    [✓] fastrec installed successfully")
+    except shutil.SameFileError:
+        print(f"    [✓] fastrec is already installed at {fastrec_dst}")
     except Exception as e:
         print(f"    [✗] Failed to install fastrec: {e}")
         sys.exit(1)
@@ -243,9 +368,11 @@ def install_tools():
         subshot_dst = Path(INSTALL_DIR) / "subshot"
         print(f"[*] Installing subshot to {subshot_dst}...")
         try:
-            shutil.copy2(subshot_src, subshot_dst)
+            copy_file(subshot_src, subshot_dst)
             os.chmod(subshot_dst, 0o755)
             print(f"    [✓] subshot installed successfully")
+        except shutil.SameFileError:
+            print(f"    [✓] subshot is already installed at {subshot_dst}")
         except Exception as e:
             print(f"    [✗] Failed to install subshot: {e}")
     else:
@@ -295,7 +422,8 @@ def uninstall_tools():
     
     for tool in tools:
         tool_path = Path(INSTALL_DIR) / tool
-        if tool_path.exists():
+        # is_symlink() catches a link whose source checkout has gone away
+        if tool_path.is_symlink() or tool_path.exists():
             print(f"[*] Removing {tool_path}...")
             try:
                 os.remove(tool_path)
@@ -309,6 +437,37 @@ def uninstall_tools():
     sys.exit(0)
 
 
+def find_executables(names):
+    """
+    Find which of the given executables are available in PATH.
+    Every PATH directory is listed once, whatever the number of tools.
+    
+    Args:
+        names: Iterable of executable names to look for
+    
+    Returns:
+        Set of the names that were found
+    """
+    wanted = set(names)
+    found = set()
+    
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    # Only stat/access the entries we are looking for
+                    if (entry.name in wanted and entry.name not in found
+                            and entry.is_file() and os.access(entry.path, os.X_OK)):
+                        found.add(entry.name)
+        except OSError:
+            continue
+        
+        if found == wanted:
+            break
+    
+    return found
+
+
 def check_dependencies():
     """
     Check if all required tools are installed.
@@ -325,16 +484,14 @@ def check_dependencies():
         "nuclei",
         "grep",
         "sort",
-        "cat"
+        "tee"
     ]
     
-    missing = []
     warnings = []
     
-    # Check core dependencies silently
-    for tool in dependencies:
-        if shutil.which(tool) is None:
-            missing.append(tool)
+    # Check core dependencies silently, with a single pass over PATH
+    found = find_executables(dependencies)
+    missing = [tool for tool in dependencies if tool not in found]
     
     # Check for subshot
     subshot_path = check_subshot_available()
@@ -359,6 +516,133 @@ def check_dependencies():
     return True
 
 
+def open_url_dedup(target_dir, output_file, fast_dedup=False):
+    """
+    Start deduplicating a stream of URL lines into output_file.
+    
+    By default the lines are streamed into sort -u. With fast_dedup they
+    go into an in-memory set instead; the memory it holds is estimated as
+    it grows and, once it passes FAST_DEDUP_MAX_MB, the set is handed to
+    sort -u and the rest of the stream follows it there.
+    
+    Args:
+        target_dir: Directory in which output_file is written
+        output_file: File name for the unique URLs
+        fast_dedup: Deduplicate with an in-memory set instead of sort -u
+    
+    Returns:
+        Tuple (feed, finish): feed(data) takes a bytes block of complete,
+        newline-terminated lines; finish() returns once output_file is written
+    """
+    # LC_ALL=C gives a plain byte comparison, and a large in-memory buffer
+    # avoids temp-file spills
+    sort_cmd = f"LC_ALL=C sort -u --parallel=$(nproc) -S 50% -o {output_file}"
+    max_bytes = FAST_DEDUP_MAX_MB * 1024 * 1024
+    urls = set()
+    used = 0
+    sort_process = None
+    broken = False
+    
+    def start_sort():
+        nonlocal sort_process
+        print(f"[>] Deduplicating with: {sort_cmd}")
+        sys.stdout.flush()
+        sort_process = subprocess.Popen(sort_cmd, shell=True, stdin=subprocess.PIPE,
+                                        cwd=target_dir)
+    
+    def write_sort(data):
+        nonlocal broken
+        if broken:
+            return
+        try:
+            sort_process.stdin.write(data)
+        except BrokenPipeError:
+            broken = True
+            print(f"\n[!] sort exited early - {output_file} may be incomplete")
+    
+    def feed(data):
+        nonlocal used
+        if sort_process:
+            write_sort(data)
+            return
+        
+        lines = data.split(b'\n')
+        for i, line in enumerate(lines):
+            line = line.rstrip(b'\r')
+            if not line or line in urls:
+                continue
+            
+            urls.add(line)
+            # bytes object itself plus its share of the set's hash table
+            used += sys.getsizeof(line) + SET_ENTRY_OVERHEAD
+            if used > max_bytes:
+                print(f"\n[!] Memory limit ({FAST_DEDUP_MAX_MB} MB) reached, falling back to sort -u")
+                start_sort()
+                write_sort(b''.join(url + b'\n' for url in urls))
+                urls.clear()
+                write_sort(b'\n'.join(lines[i + 1:]))
+                return
+    
+    def finish():
+        if sort_process:
+            try:
+                sort_process.stdin.close()
+            except BrokenPipeError:
+                pass
+            sort_process.wait()
+            return
+        
+        with open(os.path.join(target_dir, output_file), 'wb', buffering=COPY_CHUNK_SIZE) as f:
+            f.writelines(url + b'\n' for url in urls)
+    
+    if not fast_dedup:
+        start_sort()
+    
+    return feed, finish
+
+
+def js_filter_command():
+    """
+    Build the command used to extract .js URLs from a URL list.
+    Prefers ripgrep when installed and falls back to GNU grep.
+    Both run in the C locale, since URLs only need a byte match.
+    
+    Returns:
+        Command string to which the input file name is appended
+    """
+    if shutil.which("rg"):
+        return "LC_ALL=C rg -N --no-heading '\\.js$'"
+    return "LC_ALL=C grep '\\.js$'"
+
+
+def stream_output(process, file_handle=None):
+    """
+    Copy a process's stdout to our stdout in raw chunks until EOF.
+    
+    Each chunk is a single write, and stdout is flushed only when the
+    chunk contains a newline. Long runs of output become a handful of
+    write() calls instead of one print() per line.
+    
+    Args:
+        process: Popen object started with stdout=PIPE and bufsize=0
+        file_handle: Optional binary file to copy the output into
+    """
+    out = sys.stdout.buffer
+    fd = process.stdout.fileno()
+    
+    while True:
+        chunk = os.read(fd, READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        out.write(chunk)
+        if b'\n' in chunk:
+            out.flush()
+        if file_handle:
+            file_handle.write(chunk)
+    
+    out.flush()
+
+
 def run_command(command, output_file=None, cwd=None, shell=True):
     """
     Run a command with real-time output streaming.
@@ -376,12 +660,15 @@ def run_command(command, output_file=None, cwd=None, shell=True):
     print(f"[>] Running: {command}")
     print('='*70 + "\n")
     
+    # Make sure our own banner is written before raw output follows
+    sys.stdout.flush()
+    
+    file_handle = None
     try:
-        # Open output file if specified
-        file_handle = None
+        # Open output file if specified (binary, large block buffer)
         if output_file:
             file_path = os.path.join(cwd, output_file) if cwd else output_file
-            file_handle = open(file_path, 'w')
+            file_handle = open(file_path, 'wb', buffering=OUTPUT_BUFFER_SIZE)
         
         # Run the command with real-time output
         process = subprocess.Popen(
@@ -389,16 +676,12 @@ def run_command(command, output_file=None, cwd=None, shell=True):
             shell=shell,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            bufsize=0,
             cwd=cwd
         )
         
-        # Stream output in real-time
-        for line in process.stdout:
-            print(line, end='')
-            if file_handle:
-                file_handle.write(line)
+        # Stream raw chunks to the terminal and the output file
+        stream_output(process, file_handle)
         
         # Wait for process to complete
         process.wait()
@@ -422,8 +705,9 @@ def run_command(command, output_file=None, cwd=None, shell=True):
 
 def run_piped_command(command, cwd=None):
     """
-    Run a piped command with real-time output streaming.
-    Output is handled by the command itself (redirected to file).
+    Run a piped command with real-time output.
+    Output is handled by the command itself (redirected to file), so the
+    shell inherits our stdout/stderr instead of piping through Python.
     
     Args:
         command: The command string to execute
@@ -436,25 +720,19 @@ def run_piped_command(command, cwd=None):
     print(f"[>] Running: {command}")
     print('='*70 + "\n")
     
+    # Make sure our own banner is written before the child starts
+    sys.stdout.flush()
+    
     try:
-        # Run the command with real-time output
-        process = subprocess.Popen(
+        # Let the shell write straight to the terminal / redirected files
+        process = subprocess.run(
             command,
             shell=True,
-            stdout=subprocess.PIPE,
+            stdout=None,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
             cwd=cwd
         )
         
-        # Stream output in real-time
-        for line in process.stdout:
-            print(line, end='')
-        
-        # Wait for process to complete
-        process.wait()
-        
         if process.returncode != 0:
             print(f"\n[!] Command exited with code: {process.returncode}")
             # Don't return False for non-zero exit codes as some tools
@@ -468,10 +746,17 @@ def run_piped_command(command, cwd=None):
         return False
 
 
-def run_parallel_commands(cmd1, cmd2, label1, label2, cwd=None):
+def run_parallel_commands(cmd1, cmd2, label1, label2, cwd=None,
+                          output1=None, output2=None, line_sink=None):
     """
     Run two commands in parallel and wait for both to complete.
-    Shows real-time output from both commands.
+    Shows real-time output from both commands, multiplexed in a single
+    thread with a selector (epoll on Linux).
+    
+    When an output file is given for a command, its stdout is copied into
+    that file and only its stderr is shown, prefixed with its label.
+    Captured stdout is also reassembled into whole lines for line_sink,
+    so a consumer never sees a line spliced from both commands.
     
     Args:
         cmd1: First command string
@@ -479,47 +764,92 @@ def run_parallel_commands(cmd1, cmd2, label1, label2, cwd=None):
         label1: Label for first command
         label2: Label for second command
         cwd: Working directory for both commands
+        output1: Optional file (relative to cwd) for the first command's stdout
+        output2: Optional file (relative to cwd) for the second command's stdout
+        line_sink: Optional callable given bytes blocks of complete,
+                   newline-terminated lines from the captured stdouts
     """
-    import threading
-    import time
+    import selectors
     
     print(f"\n[>] Starting {label1} and {label2} in parallel...\n")
+    sys.stdout.flush()
     
-    results = {'cmd1_done': False, 'cmd2_done': False}
+    selector = selectors.DefaultSelector()
+    processes = []
     
-    def run_cmd(cmd, label, result_key):
+    for cmd, label, output in ((cmd1, label1, output1), (cmd2, label2, output2)):
+        file_handle = None
         try:
+            if output:
+                file_path = os.path.join(cwd, output) if cwd else output
+                file_handle = open(file_path, 'wb', buffering=OUTPUT_BUFFER_SIZE)
+            
             process = subprocess.Popen(
                 cmd,
                 shell=True,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                stderr=subprocess.PIPE if file_handle else subprocess.STDOUT,
+                bufsize=0,
                 cwd=cwd
             )
-            
-            for line in process.stdout:
-                print(f"[{label}] {line}", end='')
-            
-            process.wait()
-            results[result_key] = True
-            print(f"\n[✓] {label} completed.")
-            
         except Exception as e:
             print(f"\n[!] {label} error: {e}")
-            results[result_key] = True
+            if file_handle:
+                file_handle.close()
+            continue
+        
+        processes.append((process, label, file_handle))
+        prefix = f"[{label}] ".encode()
+        # Data per fd: [prefix (None for captured stdout), pending partial line, file]
+        if file_handle:
+            selector.register(process.stdout, selectors.EVENT_READ, [None, b"", file_handle])
+            selector.register(process.stderr, selectors.EVENT_READ, [prefix, b"", None])
+        else:
+            selector.register(process.stdout, selectors.EVENT_READ, [prefix, b"", None])
     
-    # Start both threads
-    thread1 = threading.Thread(target=run_cmd, args=(cmd1, label1, 'cmd1_done'))
-    thread2 = threading.Thread(target=run_cmd, args=(cmd2, label2, 'cmd2_done'))
+    out = sys.stdout.buffer
     
-    thread1.start()
-    thread2.start()
+    while selector.get_map():
+        for key, _ in selector.select():
+            prefix, pending, file_handle = key.data
+            chunk = os.read(key.fd, READ_CHUNK_SIZE)
+            
+            if not chunk:
+                # EOF - flush any unterminated last line
+                if pending and prefix is None:
+                    line_sink(pending + b"\n")
+                elif pending:
+                    out.write(prefix + pending + b"\n")
+                    out.flush()
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+                continue
+            
+            if file_handle:
+                file_handle.write(chunk)
+                if line_sink:
+                    # Pass on whole lines only, keep the remainder for later
+                    data = pending + chunk
+                    end = data.rfind(b"\n") + 1
+                    if end:
+                        line_sink(data[:end])
+                    key.data[1] = data[end:]
+                continue
+            
+            # Prefix every complete line, keep the remainder for later
+            lines = (pending + chunk).split(b"\n")
+            key.data[1] = lines.pop()
+            if lines:
+                out.write(b"".join(prefix + line + b"\n" for line in lines))
+                out.flush()
     
-    # Wait for both to complete
-    thread1.join()
-    thread2.join()
+    selector.close()
+    
+    for process, label, file_handle in processes:
+        process.wait()
+        if file_handle:
+            file_handle.close()
+        print(f"\n[✓] {label} completed.")
     
     print(f"\n[✓] Both {label1} and {label2} finished.\n")
 
@@ -549,11 +879,12 @@ def run_subshot(target_dir):
     alive_subs_path = os.path.join(target_dir, "alive_subs.txt")
     
     # Check if alive_subs.txt exists and has content
-    if not os.path.exists(alive_subs_path):
+    st = stat_or_none(alive_subs_path)
+    if not st:
         print("[!] alive_subs.txt not found. Skipping screenshots...")
         return False
     
-    if os.path.getsize(alive_subs_path) == 0:
+    if st.st_size == 0:
         print("[!] alive_subs.txt is empty. Skipping screenshots...")
         return False
     
@@ -566,6 +897,7 @@ def run_subshot(target_dir):
     print(f"\n{'='*70}")
     print(f"[>] Running: subshot -f alive_subs.txt -o screenshots")
     print('='*70 + "\n")
+    sys.stdout.flush()
     
     try:
         process = subprocess.Popen(
@@ -573,13 +905,11 @@ def run_subshot(target_dir):
             shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            bufsize=0,
             cwd=target_dir
         )
         
-        for line in process.stdout:
-            print(line, end='')
+        stream_output(process)
         
         process.wait()
         
@@ -667,8 +997,78 @@ def create_target_directory(target_name):
     return target_dir
 
 
-def run_recon():
-    """Run the main reconnaissance workflow."""
+def run_xss_branch(target_dir):
+    """
+    Run step 5: extract XSS candidates with gf and check them with kxss.
+    
+    Args:
+        target_dir: Path to the target directory containing allurls.txt
+    """
+    # =========================================================================
+    # STEP 5: XSS patterns + kxss
+    # =========================================================================
+    print("\n\n[STEP 5/7] Extracting XSS patterns with gf and kxss")
+    print("-"*70)
+    
+    # Extract XSS patterns
+    cmd_xss = "gf xss < allurls.txt >> xss.txt"
+    run_piped_command(cmd_xss, cwd=target_dir)
+    
+    # Run kxss
+    cmd_kxss = "kxss < xss.txt >> kxss.txt"
+    run_piped_command(cmd_kxss, cwd=target_dir)
+
+
+def run_js_branch(target_dir):
+    """
+    Run steps 6-7: extract JS URLs, probe them with httpx and scan with nuclei.
+    
+    Args:
+        target_dir: Path to the target directory containing allurls.txt
+    """
+    # =========================================================================
+    # STEP 6: Extract JS URLs
+    # =========================================================================
+    print("\n\n[STEP 6/7] Extracting JavaScript URLs")
+    print("-"*70)
+    
+    # Extract JS URLs (ripgrep if available, byte-locale grep otherwise)
+    cmd_grep_js = f"{js_filter_command()} allurls.txt > alljs.txt"
+    run_piped_command(cmd_grep_js, cwd=target_dir)
+    
+    # =========================================================================
+    # STEP 7: Probe JS URLs and apply Nuclei
+    # =========================================================================
+    print("\n\n[STEP 7/7] Checking alive JS files and running Nuclei scans")
+    print("-"*70)
+    
+    # Warn if path still contains /path
+    if "/path" in NUCLEI_TEMPLATES_PATH:
+        print("\n" + "!"*70)
+        print("[!] WARNING: NUCLEI_TEMPLATES_PATH still contains '/path'!")
+        print("[!] Please update the path at the top of this script.")
+        print("[!] Skipping nuclei scan...")
+        print("!"*70 + "\n")
+        
+        # Still check alive JS files
+        cmd_httpx_js = f"httpx {HTTPX_OPTIONS} -l alljs.txt -o alive_js.txt"
+        run_piped_command(cmd_httpx_js, cwd=target_dir)
+    else:
+        # Nuclei consumes URLs as soon as httpx emits them; tee keeps alive_js.txt
+        cmd_js_nuclei = (
+            f"httpx {HTTPX_OPTIONS} -l alljs.txt -silent | tee alive_js.txt | "
+            f"nuclei -t {NUCLEI_TEMPLATES_PATH}"
+        )
+        run_piped_command(cmd_js_nuclei, cwd=target_dir)
+
+
+def run_recon(fast_dedup=False):
+    """
+    Run the main reconnaissance workflow.
+    
+    Args:
+        fast_dedup: Deduplicate URLs with an in-memory set instead of sort -u
+    """
     
     # Display banner
     print_banner()
@@ -708,16 +1108,17 @@ def run_recon():
     
     if mode == 1:
         # Mode 1: Single domain
-        cmd = f"subfinder -d {target_input} -all | httpx -o alive_subs.txt"
+        cmd = f"subfinder -d {target_input} -all | httpx {HTTPX_OPTIONS} -o alive_subs.txt"
     else:
         # Mode 2: Wildcard list
-        cmd = f"subfinder -dL wildcards.txt -all | httpx -o alive_subs.txt"
+        cmd = f"subfinder -dL wildcards.txt -all | httpx {HTTPX_OPTIONS} -o alive_subs.txt"
     
     run_piped_command(cmd, cwd=target_dir)
     
     # Check if alive_subs.txt was created and has content
     alive_subs_path = os.path.join(target_dir, "alive_subs.txt")
-    if not os.path.exists(alive_subs_path) or os.path.getsize(alive_subs_path) == 0:
+    st = stat_or_none(alive_subs_path)
+    if not st or st.st_size == 0:
         print("\n[!] Warning: No alive subdomains found. Continuing anyway...")
     
     # =========================================================================
@@ -726,79 +1127,64 @@ def run_recon():
     print("\n\n[STEP 2/7] Taking screenshots with SubShot")
     print("-"*70)
     
+    screenshot_thread = None
     screenshot_choice = input("\n[?] Take screenshots? (y = yes, s = skip): ").strip().lower()
     if screenshot_choice == 'y':
-        run_subshot(target_dir)
+        # Screenshots only need alive_subs.txt, so they run in the background
+        # while GAU/Katana fetch URLs
+        print("[*] Taking screenshots in the background, continuing...")
+        screenshot_thread = threading.Thread(target=run_subshot, args=(target_dir,))
+        screenshot_thread.start()
     else:
         print("[*] Skipping screenshots, continuing...")
     
     # =========================================================================
-    # STEP 3: GAU and Katana (parallel)
+    # STEP 3 + 4: GAU and Katana (parallel), streamed straight into allurls.txt
     # =========================================================================
-    print("\n\n[STEP 3/7] Running GAU and Katana (parallel)")
+    print("\n\n[STEP 3-4/7] Running GAU and Katana (parallel) and combining URLs")
     print("-"*70)
+    print("[*] URLs are saved to gau.txt / katana.txt and deduplicated into allurls.txt")
+    
+    if fast_dedup:
+        print("[*] Deduplicating URLs in memory...")
     
+    # Both producers stream straight into the deduplicator while their
+    # output is also saved, so gau.txt/katana.txt are never read back.
+    # Each has its own pipe and only whole lines are passed on, so lines
+    # from the two tools can't be spliced together
+    dedup_feed, dedup_finish = open_url_dedup(target_dir, "allurls.txt", fast_dedup)
     run_parallel_commands(
-        cmd1="cat alive_subs.txt | gau --threads 5 >> gau.txt",
-        cmd2="cat alive_subs.txt | katana -d 5 -silent >> katana.txt",
+        cmd1="gau --threads 5 < alive_subs.txt",
+        cmd2="katana -list alive_subs.txt -d 5 -silent",
         label1="GAU",
         label2="Katana",
-        cwd=target_dir
+        cwd=target_dir,
+        output1="gau.txt",
+        output2="katana.txt",
+        line_sink=dedup_feed
     )
+    dedup_finish()
+    print("[✓] allurls.txt written.")
     
     # =========================================================================
-    # STEP 4: Combine URLs
-    # =========================================================================
-    print("\n\n[STEP 4/7] Combining URLs")
-    print("-"*70)
-    
-    cmd_combine = "cat katana.txt gau.txt | sort -u > allurls.txt"
-    run_piped_command(cmd_combine, cwd=target_dir)
-    
-    # =========================================================================
-    # STEP 5: XSS patterns + kxss
-    # =========================================================================
-    print("\n\n[STEP 5/7] Extracting XSS patterns with gf and kxss")
-    print("-"*70)
-    
-    # Extract XSS patterns
-    cmd_xss = "cat allurls.txt | gf xss >> xss.txt"
-    run_piped_command(cmd_xss, cwd=target_dir)
-    
-    # Run kxss
-    cmd_kxss = "cat xss.txt | kxss >> kxss.txt"
-    run_piped_command(cmd_kxss, cwd=target_dir)
-    
-    # =========================================================================
-    # STEP 6: Extract JS URLs
+    # STEPS 5-7: XSS and JS branches (parallel)
     # =========================================================================
-    print("\n\n[STEP 6/7] Extracting JavaScript URLs")
-    print("-"*70)
+    # Both branches only read allurls.txt, so they run side by side
+    print("\n\n[*] Running XSS (step 5) and JS + Nuclei (steps 6-7) branches in parallel...")
     
-    # Extract JS URLs
-    cmd_grep_js = "grep '\\.js$' allurls.txt > alljs.txt"
-    run_piped_command(cmd_grep_js, cwd=target_dir)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        branches = [
+            executor.submit(run_xss_branch, target_dir),
+            executor.submit(run_js_branch, target_dir)
+        ]
     
-    # Check alive JS files
-    cmd_httpx_js = "cat alljs.txt | httpx -o alive_js.txt"
-    run_piped_command(cmd_httpx_js, cwd=target_dir)
+    for branch in branches:
+        branch.result()
     
-    # =========================================================================
-    # STEP 7: Apply Nuclei
-    # =========================================================================
-    print("\n\n[STEP 7/7] Running Nuclei scans")
-    print("-"*70)
-    
-    # Warn if path still contains /path
-    if "/path" in NUCLEI_TEMPLATES_PATH:
-        print("\n" + "!"*70)
-        print("[!] WARNING: NUCLEI_TEMPLATES_PATH still contains '/path'!")
-        print("[!] Please update the path at the top of this script.")
-        print("[!] Skipping nuclei scan...")
-        print("!"*70 + "\n")
-    else:
-        cmd_nuclei = f"cat alive_js.txt | nuclei -t {NUCLEI_TEMPLATES_PATH}"
-        run_piped_command(cmd_nuclei, cwd=target_dir)
+    # Wait for background screenshots before summarizing
+    if screenshot_thread:
+        print("\n[*] Waiting for screenshots to finish...")
+        screenshot_thread.join()
     
     # =========================================================================
     # COMPLETION
@@ -823,10 +1209,15 @@ def run_recon():
     
     results = {}
     
+    # One directory listing instead of a stat per expected file
+    with os.scandir(target_dir) as dir_entries:
+        entries = {entry.name: entry for entry in dir_entries}
+    
     for filename in expected_files:
-        filepath = os.path.join(target_dir, filename)
-        if os.path.exists(filepath):
-            lines = count_lines(filepath)
+        entry = entries.get(filename)
+        if entry:
+            # Empty files need not be opened at all
+            lines = count_lines(entry.path) if entry.stat().st_size else 0
             results[filename] = lines
             print(f"    [✓] {filename} ({lines} lines)")
         else:
@@ -834,26 +1225,32 @@ def run_recon():
             print(f"    [✗] {filename} (not created)")
     
     # Check screenshots folder
-    screenshots_dir = os.path.join(target_dir, "screenshots")
-    if os.path.exists(screenshots_dir) and os.path.isdir(screenshots_dir):
-        screenshot_count = len([f for f in os.listdir(screenshots_dir) if f.endswith('.png')])
+    screenshots_entry = entries.get("screenshots")
+    if screenshots_entry and screenshots_entry.is_dir():
+        with os.scandir(screenshots_entry.path) as shots:
+            screenshot_count = sum(1 for entry in shots if entry.name.endswith(('.jpg', '.png')))
         results["screenshots"] = screenshot_count
         print(f"    [✓] screenshots/ ({screenshot_count} images)")
     else:
         results["screenshots"] = 0
         print(f"    [✗] screenshots/ (not created)")
     
-    # Send to Telegram (if configured)
-    if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
+    # Send to Telegram (if configured) without blocking the rest of the output
+    telegram = send_telegram_notification(target_name, target_dir, results)
+    if telegram:
         print("\n[*] Sending results to Telegram...")
-        if send_telegram_notification(target_name, target_dir, results):
-            print("[✓] Results sent to Telegram!")
-        else:
-            print("[!] Failed to send to Telegram.")
     
     print("\n" + "="*70)
     print(" Thank you for using fastrec!")
     print("="*70 + "\n")
+    
+    if telegram:
+        thread, outcome = telegram
+        thread.join()
+        if outcome['sent']:
+            print("[✓] Results sent to Telegram!")
+        else:
+            print(f"[!] Telegram notification failed: {outcome['error']}")
 
 
 def main():
@@ -864,6 +1261,7 @@ def main():
         epilog='''
 Examples:
   fastrec                  Run the reconnaissance workflow
+  fastrec --fast-dedup     Deduplicate URLs in memory instead of sorting
   sudo fastrec --install   Install fastrec and subshot system-wide
   sudo fastrec --uninstall Remove fastrec and subshot from system
   fastrec --version        Show version
@@ -885,6 +1283,12 @@ Target folders will be created in your current working directory.
         help='Remove fastrec and subshot from /usr/local/bin (requires sudo)'
     )
     
+    parser.add_argument(
+        '--fast-dedup',
+        action='store_true',
+        help='Deduplicate URLs in memory instead of with sort -u (output is unsorted)'
+    )
+    
     parser.add_argument(
         '--version', '-v',
         action='version',
@@ -898,7 +1302,7 @@ Target folders will be created in your current working directory.
     elif args.uninstall:
         uninstall_tools()
     else:
-        run_recon()
+        run_recon(fast_dedup=args.fast_dedup)
 
 
 if __name__ == "__main__":
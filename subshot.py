@@ -14,17 +14,48 @@ License: GPL-3.0
 """
 
 import argparse
+import asyncio
+import hashlib
 import os
 import re
 import sys
 import shutil
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlsplit
 
 VERSION = "1.0.0"
 INSTALL_DIR = "/usr/local/bin"
+DEFAULT_CONCURRENCY = 8
+DNS_WORKERS = 64
+
+# Resolver errors that mean the name definitely has no address; anything
+# else (EAI_AGAIN, EAI_FAIL, ...) may be transient and keeps the host
+_DNS_MISSING_ERRORS = frozenset(
+    getattr(socket, name) for name in ('EAI_NONAME', 'EAI_NODATA') if hasattr(socket, name)
+)
+DEFAULT_VIEWPORT = {'width': 1280, 'height': 720}
+
+# Screenshot encoding - JPEG is much smaller and faster to encode than PNG
+DEFAULT_FORMAT = 'jpeg'
+JPEG_QUALITY = 70
+FORMAT_EXTENSIONS = {'jpeg': '.jpg', 'png': '.png'}
+
+# Pre-compiled patterns used by sanitize_filename and parse_viewport
+_PROTO_RE = re.compile(r'^https?://')
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*\s]')
+_VIEWPORT_RE = re.compile(r'^(\d+)[xX](\d+)$')
+
+# Requests aborted while loading a page - not needed for a screenshot
+BLOCKED_RESOURCE_TYPES = frozenset({'media', 'font'})
+_TRACKER_RE = re.compile(
+    r'^https?://([^/]+\.)?(google-analytics\.com|googletagmanager\.com|doubleclick\.net|'
+    r'connect\.facebook\.net|hotjar\.com|segment\.io|mixpanel\.com)(:\d+)?/'
+)
 
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -122,13 +153,37 @@ def install_tool():
     
     # Install subshot
     print(f"[*] Installing subshot to {subshot_dst}...")
-    try:
-        shutil.copy2(subshot_src, subshot_dst)
-        os.chmod(subshot_dst, 0o755)
-        print(f"    [✓] subshot installed successfully")
-    except Exception as e:
-        print(f"    [✗] Failed to install subshot: {e}")
-        sys.exit(1)
+    
+    # Running the installed command with --install - nothing to do
+    if subshot_dst.exists() and os.path.samefile(subshot_src, subshot_dst):
+        print(f"    [✓] subshot is already installed at {subshot_dst}")
+    else:
+        # Build the new entry under a temporary name, then swap it in
+        tmp_dst = Path(INSTALL_DIR) / f".subshot.tmp-{os.getpid()}"
+        try:
+            # Prefer a hard link, then a symlink (e.g. across filesystems),
+            # so the installed command tracks the source; copy as a last resort
+            try:
+                os.link(subshot_src, tmp_dst)
+                method = "hard link"
+            except OSError:
+                try:
+                    os.symlink(subshot_src.resolve(), tmp_dst)
+                    method = "symlink"
+                except OSError:
+                    shutil.copy2(subshot_src, tmp_dst)
+                    method = "copy"
+            
+            os.replace(tmp_dst, subshot_dst)
+            os.chmod(subshot_dst, 0o755)
+            print(f"    [✓] subshot installed successfully ({method})")
+        except Exception as e:
+            try:
+                tmp_dst.unlink()
+            except FileNotFoundError:
+                pass
+            print(f"    [✗] Failed to install subshot: {e}")
+            sys.exit(1)
     
     # Success message
     print("\n" + "="*70)
@@ -167,7 +222,8 @@ def uninstall_tool():
     
     tool_path = Path(INSTALL_DIR) / "subshot"
     
-    if tool_path.exists():
+    # is_symlink() catches a link whose source checkout has gone away
+    if tool_path.is_symlink() or tool_path.exists():
         print(f"[*] Removing {tool_path}...")
         try:
             os.remove(tool_path)
@@ -193,14 +249,33 @@ def sanitize_filename(domain: str) -> str:
         A sanitized string safe for use as filename
     """
     # Remove protocol if present for cleaner filenames
-    clean = domain.replace('https://', '').replace('http://', '')
+    clean = _PROTO_RE.sub('', domain, count=1)
     # Replace invalid filename characters with hyphens
-    clean = re.sub(r'[<>:"/\\|?*\s]', '-', clean)
+    clean = _SANITIZE_RE.sub('-', clean)
     # Remove trailing dots and hyphens
     clean = clean.strip('.-')
     return clean
 
 
+def parse_viewport(value: str) -> dict:
+    """
+    Parse a WIDTHxHEIGHT string into a Playwright viewport.
+    
+    Args:
+        value: Viewport string, e.g. "1280x720"
+        
+    Returns:
+        Dict with 'width' and 'height'
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not WIDTHxHEIGHT
+    """
+    match = _VIEWPORT_RE.match(value.strip())
+    if not match or int(match.group(1)) == 0 or int(match.group(2)) == 0:
+        raise argparse.ArgumentTypeError(f"invalid viewport '{value}', expected WIDTHxHEIGHT")
+    return {'width': int(match.group(1)), 'height': int(match.group(2))}
+
+
 def normalize_url(subdomain: str) -> str:
     """
     Normalize subdomain to a full URL.
@@ -218,24 +293,40 @@ def normalize_url(subdomain: str) -> str:
     return subdomain
 
 
+def stream_list(filepath: str):
+    """
+    Lazily read subdomains from a text file.
+    
+    Args:
+        filepath: Path to the text file containing subdomains
+        
+    Yields:
+        Stripped, non-empty lines in file order
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
 def load_list(filepath: str) -> list:
     """
-    Load list of subdomains from a text file.
+    Load list of unique subdomains from a text file.
     
     Args:
         filepath: Path to the text file containing subdomains
         
     Returns:
-        List of subdomain strings (one per line)
+        List of subdomain strings (one per line), duplicates removed
+        while keeping the original order
         
     Raises:
         FileNotFoundError: If the file doesn't exist
         Exception: For other file reading errors
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            subdomains = [line.strip() for line in f if line.strip()]
-        return subdomains
+        return list(dict.fromkeys(stream_list(filepath)))
     except FileNotFoundError:
         print(f"[!] Error: File not found: {filepath}")
         sys.exit(1)
@@ -244,48 +335,166 @@ def load_list(filepath: str) -> list:
         sys.exit(1)
 
 
-def take_screenshot(url: str, output_path: str, retries: int = 2, timeout: int = 30000) -> tuple:
+async def handle_route(route, blocked_types: frozenset):
+    """
+    Abort requests for heavy resource types and known trackers,
+    let everything else through.
+    
+    Args:
+        route: Playwright route for the intercepted request
+        blocked_types: Resource types to abort (e.g. 'media', 'font')
+    """
+    request = route.request
+    if request.resource_type in blocked_types or _TRACKER_RE.match(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def file_size(path: str) -> int:
+    """
+    Get the size of a file with a single stat call.
+    
+    Returns:
+        Size in bytes, or 0 if the file does not exist
+    """
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def resolves(subdomain: str) -> bool:
+    """
+    Check whether a subdomain's host resolves in DNS.
+    
+    Args:
+        subdomain: Domain or URL string
+        
+    Returns:
+        False if DNS says the name does not exist or has no address,
+        True otherwise (including transient resolver failures)
+    """
+    try:
+        parts = urlsplit(normalize_url(subdomain))
+        port = parts.port or (80 if parts.scheme == 'http' else 443)
+        socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        return e.errno not in _DNS_MISSING_ERRORS
+    except (ValueError, UnicodeError):
+        # Malformed host/port - let the browser report the real error
+        return True
+    return True
+
+
+def prefilter_dns(subdomains: list) -> list:
+    """
+    Drop subdomains whose host does not resolve, looking them up in parallel.
+    Dead hosts would otherwise each cost a browser context and a failed
+    navigation.
+    
+    Args:
+        subdomains: List of subdomain strings
+        
+    Returns:
+        List of subdomains that resolved, in the original order
+    """
+    with ThreadPoolExecutor(max_workers=DNS_WORKERS) as executor:
+        alive = list(executor.map(resolves, subdomains))
+    return [subdomain for subdomain, ok in zip(subdomains, alive) if ok]
+
+
+async def capture_page(page, url: str, output_path: str, timeout: int, screenshot_options: dict):
     """
-    Take a screenshot of a URL using Playwright headless browser.
+    Navigate an open page to a URL and save a screenshot of it.
     
     Args:
+        page: Playwright page to use
+        url: The URL to capture
+        output_path: Path where to save the screenshot
+        timeout: Page load timeout in milliseconds
+        screenshot_options: Extra keyword arguments for page.screenshot
+    """
+    # Set timeout and navigate; don't wait for the network to go idle,
+    # analytics-heavy pages may never get there
+    page.set_default_timeout(timeout)
+    await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+    
+    # Give the page a short, bounded chance to finish loading
+    try:
+        await page.wait_for_load_state('load', timeout=min(5000, timeout // 3))
+    except PlaywrightTimeout:
+        pass
+    
+    # Take screenshot
+    await page.screenshot(path=output_path, full_page=False, **screenshot_options)
+
+
+async def take_screenshot(browser, url: str, output_path: str, retries: int = 2, timeout: int = 30000,
+                          block_images: bool = False, image_format: str = DEFAULT_FORMAT,
+                          viewport: dict = None, hard_timeout: int = None) -> tuple:
+    """
+    Take a screenshot of a URL using an already running Playwright browser.
+    A fresh browser context is created for each attempt and always closed.
+    
+    Args:
+        browser: Launched Playwright browser to open the page in
         url: The URL to capture
         output_path: Path where to save the screenshot
         retries: Number of retry attempts (default: 2)
         timeout: Page load timeout in milliseconds (default: 30000)
+        block_images: Also abort image requests (default: False)
+        image_format: 'jpeg' or 'png' (default: jpeg)
+        viewport: Dict with 'width' and 'height' (default: 1280x720)
+        hard_timeout: Wall-clock limit in milliseconds for each attempt's
+                      navigation + screenshot (default: 2 x timeout)
         
     Returns:
         Tuple (success: bool, error_message: str or None)
     """
+    if not hard_timeout:
+        hard_timeout = 2 * timeout
+    
     attempt = 0
     last_error = None
     
+    blocked_types = BLOCKED_RESOURCE_TYPES
+    if block_images:
+        blocked_types = blocked_types | {'image'}
+    
+    screenshot_options = {'type': image_format}
+    if image_format == 'jpeg':
+        screenshot_options['quality'] = JPEG_QUALITY
+    
     while attempt < retries:
         attempt += 1
+        context = None
         try:
-            with sync_playwright() as p:
-                # Launch Chromium in headless mode
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-                )
-                page = context.new_page()
-                
-                # Set timeout and navigate
-                page.set_default_timeout(timeout)
-                page.goto(url, wait_until='networkidle')
-                
-                # Take screenshot
-                page.screenshot(path=output_path, full_page=False)
-                
-                # Cleanup
-                browser.close()
-                
-                return (True, None)
+            # Contexts are cheap and isolated; the browser is shared
+            context = await browser.new_context(
+                viewport=viewport or DEFAULT_VIEWPORT,
+                device_scale_factor=1,
+                user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+            )
+            await context.route("**/*", lambda route: handle_route(route, blocked_types))
+            page = await context.new_page()
+            
+            # Bound this attempt's wall-clock time; on expiry the context
+            # is closed below like any other failure
+            await asyncio.wait_for(
+                capture_page(page, url, output_path, timeout, screenshot_options),
+                timeout=hard_timeout / 1000
+            )
+            
+            return (True, None)
                 
         except PlaywrightTimeout:
             last_error = f"Timeout after {timeout/1000}s"
+        except asyncio.TimeoutError:
+            last_error = f"Hard timeout after {hard_timeout/1000}s"
+        except asyncio.CancelledError:
+            # Cancelled from outside - close the context below and stop
+            raise
         except Exception as e:
             error_str = str(e)
             # Simplify common error messages
@@ -299,6 +508,13 @@ def take_screenshot(url: str, output_path: str, retries: int = 2, timeout: int =
                 last_error = "SSL/Certificate error"
             else:
                 last_error = error_str[:100]
+        finally:
+            # Cleanup
+            if context:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
         
         if attempt < retries:
             continue
@@ -306,44 +522,99 @@ def take_screenshot(url: str, output_path: str, retries: int = 2, timeout: int =
     return (False, last_error)
 
 
-def process_subdomains(subdomains: list, output_dir: Path, timeout: int = 30) -> tuple:
+async def process_subdomains(subdomains: list, output_dir: Path, timeout: int = 30,
+                             concurrency: int = DEFAULT_CONCURRENCY, block_images: bool = False,
+                             image_format: str = DEFAULT_FORMAT, force: bool = False,
+                             hard_timeout: int = None, viewport: dict = None) -> tuple:
     """
     Process a list of subdomains and take screenshots.
     
+    A single Chromium instance is shared by all pages; a semaphore caps
+    how many navigations are in flight at once.
+    
     Args:
         subdomains: List of subdomain strings
         output_dir: Path object for output directory
         timeout: Timeout in seconds per screenshot
+        concurrency: Number of screenshots taken in parallel
+        block_images: Also abort image requests
+        image_format: 'jpeg' or 'png'
+        force: Re-take screenshots that already exist in output_dir
+        hard_timeout: Wall-clock limit in seconds per attempt
+                      (default: 2 x timeout)
+        viewport: Dict with 'width' and 'height' (default: 1280x720)
         
     Returns:
-        Tuple (success_count, fail_count)
+        Tuple (success_count, fail_count, skipped_count)
     """
-    success_count = 0
-    fail_count = 0
-    
-    for i, subdomain in enumerate(subdomains, 1):
-        # Normalize URL
-        url = normalize_url(subdomain)
+    if not hard_timeout:
+        hard_timeout = 2 * timeout
+    
+    extension = FORMAT_EXTENSIONS[image_format]
+    total = len(subdomains)
+    out_str = str(output_dir)
+    counts = {'success': 0, 'fail': 0, 'skipped': 0}
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    launch_lock = asyncio.Lock()
+    
+    async with async_playwright() as p:
+        # Launch Chromium once and share it across all pages
+        browser = await p.chromium.launch(headless=True)
         
-        # Create sanitized filename
-        filename = sanitize_filename(subdomain) + '.png'
-        output_path = output_dir / filename
+        async def get_browser():
+            # Health check - relaunch if the browser died
+            nonlocal browser
+            async with launch_lock:
+                if not browser.is_connected():
+                    browser = await p.chromium.launch(headless=True)
+            return browser
         
-        # Progress indicator
-        print(f"    [{i}/{len(subdomains)}] {subdomain}", end=' ... ')
-        sys.stdout.flush()
-        
-        # Take screenshot with retries
-        success, error = take_screenshot(url, str(output_path), retries=2, timeout=timeout * 1000)
+        async def worker(i, subdomain):
+            # Create sanitized filename; the hash keeps subdomains that
+            # sanitize to the same name from overwriting each other
+            digest = hashlib.sha1(subdomain.encode()).hexdigest()[:8]
+            filename = f"{sanitize_filename(subdomain)}-{digest}{extension}"
+            output_path = os.path.join(out_str, filename)
+            
+            # Skip screenshots left by a previous (possibly interrupted) run
+            if not force and file_size(output_path) > 0:
+                counts['skipped'] += 1
+                print(f"    [{i}/{total}] {subdomain} ... SKIP (exists)")
+                return
+            
+            async with semaphore:
+                # Normalize URL
+                url = normalize_url(subdomain)
+                
+                # Take screenshot with retries, each bounded by the hard timeout
+                success, error = await take_screenshot(await get_browser(), url, output_path,
+                                                       retries=2, timeout=timeout * 1000,
+                                                       block_images=block_images,
+                                                       image_format=image_format,
+                                                       viewport=viewport,
+                                                       hard_timeout=hard_timeout * 1000)
+            
+            # Progress indicator (flushed every 10 results)
+            if success:
+                counts['success'] += 1
+                status = "OK"
+            else:
+                counts['fail'] += 1
+                status = f"FAIL ({error})"
+            done = counts['success'] + counts['fail'] + counts['skipped']
+            print(f"    [{i}/{total}] {subdomain} ... {status}", flush=done % 10 == 0)
         
-        if success:
-            print("OK")
-            success_count += 1
-        else:
-            print(f"FAIL ({error})")
-            fail_count += 1
+        try:
+            await asyncio.gather(*[worker(i, subdomain)
+                                   for i, subdomain in enumerate(subdomains, 1)])
+        finally:
+            sys.stdout.flush()
+            try:
+                await browser.close()
+            except Exception:
+                pass
     
-    return success_count, fail_count
+    return counts['success'], counts['fail'], counts['skipped']
 
 
 def run_cli_mode(args):
@@ -358,6 +629,7 @@ def run_cli_mode(args):
     filepath = args.file
     output_dir = Path(args.output)
     timeout = args.timeout
+    concurrency = args.concurrency
     
     # Verify file exists
     if not os.path.exists(filepath):
@@ -370,20 +642,34 @@ def run_cli_mode(args):
     print(f"\n[*] SubShot - Taking screenshots")
     print(f"[+] Input file: {filepath}")
     print(f"[+] Output directory: {output_dir.absolute()}")
+    print(f"[+] Concurrency: {concurrency}")
     
     # Load subdomain list
     subdomains = load_list(filepath)
-    print(f"[+] Loaded {len(subdomains)} subdomain(s)\n")
+    print(f"[+] Loaded {len(subdomains)} subdomain(s)")
     
     if len(subdomains) == 0:
         print("[!] No subdomains to process.")
         return
     
+    # Skip hosts that don't resolve before spending a browser on them
+    total = len(subdomains)
+    subdomains = prefilter_dns(subdomains)
+    print(f"[+] DNS filter: kept {len(subdomains)}/{total}\n")
+    
+    if len(subdomains) == 0:
+        print("[!] No resolvable subdomains to process.")
+        return
+    
     # Process subdomains
-    success_count, fail_count = process_subdomains(subdomains, output_dir, timeout)
+    success_count, fail_count, skipped_count = asyncio.run(process_subdomains(
+        subdomains, output_dir, timeout, concurrency, args.block_images, args.format, args.force,
+        args.hard_timeout, args.viewport
+    ))
     
     # Summary
-    print(f"\n[+] Completed: {success_count} success, {fail_count} failed")
+    print(f"\n[+] Completed: {success_count} success, {fail_count} failed, "
+          f"{skipped_count} skipped")
     print(f"[+] Screenshots saved to: {output_dir.absolute()}")
 
 
@@ -430,20 +716,32 @@ def run_interactive_mode():
     # Load subdomain list
     print(f"[+] Loading subdomains from: {filepath}")
     subdomains = load_list(filepath)
-    print(f"[+] Loaded {len(subdomains)} subdomain(s)\n")
+    print(f"[+] Loaded {len(subdomains)} subdomain(s)")
     
     if len(subdomains) == 0:
         print("[!] No subdomains to process.")
         return
     
+    # Skip hosts that don't resolve before spending a browser on them
+    total = len(subdomains)
+    subdomains = prefilter_dns(subdomains)
+    print(f"[+] DNS filter: kept {len(subdomains)}/{total}\n")
+    
+    if len(subdomains) == 0:
+        print("[!] No resolvable subdomains to process.")
+        return
+    
     # Default timeout
     timeout = 30  # seconds
     
     # Process subdomains
-    success_count, fail_count = process_subdomains(subdomains, output_dir, timeout)
+    success_count, fail_count, skipped_count = asyncio.run(
+        process_subdomains(subdomains, output_dir, timeout)
+    )
     
     # Summary
-    print(f"\n[+] Completed: {success_count} success, {fail_count} failed")
+    print(f"\n[+] Completed: {success_count} success, {fail_count} failed, "
+          f"{skipped_count} skipped")
     print(f"[+] Screenshots saved to: {output_dir.absolute()}")
 
 
@@ -462,6 +760,7 @@ Examples:
   CLI mode:
     subshot -f alive_subs.txt -o screenshots/
     subshot -f targets.txt -o output/ -t 60
+    subshot -f targets.txt -o output/ -c 16
     
   Installation:
     sudo subshot --install
@@ -483,6 +782,40 @@ Examples:
         default=30,
         help='Timeout per screenshot in seconds (default: 30)'
     )
+    parser.add_argument(
+        '--hard-timeout',
+        type=int,
+        help='Hard wall-clock limit per attempt in seconds (default: 2x timeout)'
+    )
+    parser.add_argument(
+        '-c', '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Number of screenshots taken in parallel (default: {DEFAULT_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--viewport',
+        type=parse_viewport,
+        default=DEFAULT_VIEWPORT,
+        metavar='WxH',
+        help='Browser viewport size (default: 1280x720)'
+    )
+    parser.add_argument(
+        '--block-images',
+        action='store_true',
+        help='Do not load images (faster, but pages may look incomplete)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=sorted(FORMAT_EXTENSIONS),
+        default=DEFAULT_FORMAT,
+        help=f'Screenshot image format (default: {DEFAULT_FORMAT})'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-take screenshots that already exist in the output directory'
+    )
     parser.add_argument(
         '--install',
         action='store_true',